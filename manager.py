@@ -16,24 +16,74 @@ Features:
 API Version: 1.0.0
 """
 
+import inspect
+import io
 import logging
+import queue
+import sys
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import xml.etree.ElementTree as ET
 import html
 import re
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from urllib.parse import urlparse
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    import numpy as np
+except ImportError:
+    # NumPy ships with the main LEDMatrix install; the plugin degrades to
+    # pure-PIL paths if it is unavailable
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _copy_strip_window(dst, src, x):
+        """Copy the visible window out of the scroll strip (JIT-compiled)."""
+        dst[:, :, :] = src[:, x:x + dst.shape[1], :]
+else:
+    def _copy_strip_window(dst, src, x):
+        """Copy the visible window out of the scroll strip (numpy fallback)."""
+        dst[:, :, :] = src[:, x:x + dst.shape[1], :]
+
 from src.plugin_system.base_plugin import BasePlugin
 from src.common.scroll_helper import ScrollHelper
 from src.common.logo_helper import LogoHelper
 
 logger = logging.getLogger(__name__)
 
+# Font file bytes and constructed faces, shared across plugin reinits -
+# each TTF is read from disk once per process, and every (path, size)
+# variant reuses the in-memory copy
+_FONT_DATA: Dict[str, bytes] = {}
+_FONT_CACHE: Dict[tuple, ImageFont.FreeTypeFont] = {}
+
+
+def _load_truetype(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font with process-wide file and face caching."""
+    key = (path, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        data = _FONT_DATA.get(path)
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+            _FONT_DATA[path] = data
+        font = ImageFont.truetype(io.BytesIO(data), size)
+        _FONT_CACHE[key] = font
+    return font
+
 
 class NewsTickerPlugin(BasePlugin):
     """
@@ -61,6 +111,13 @@ class NewsTickerPlugin(BasePlugin):
         'Other': 'https://www.coveringthecorner.com/rss/current.xml'
     }
 
+    # Bound on the standalone text bitmap LRU cache
+    TEXT_BITMAP_CACHE_SIZE = 256
+
+    # Precompiled patterns for headline cleanup
+    _WS_RE = re.compile(r'\s+')
+    _LEAD_DASH_RE = re.compile(r'^\s*-\s*')
+
     # Feed name to logo file mapping
     FEED_LOGO_MAP = {
         'MLB': 'mlbn.png',  # MLB Network logo
@@ -128,6 +185,11 @@ class NewsTickerPlugin(BasePlugin):
         self.headlines_per_feed = self.global_config.get('headlines_per_feed', 2)
         self.font_size = self.global_config.get('font_size', 12)
         self.target_fps = self.global_config.get('target_fps') or self.global_config.get('scroll_target_fps', 100)
+        # Opt-in: push frames to the display from a worker thread so frame
+        # composition overlaps the bus transmit. Off by default - it assumes
+        # the display manager tolerates update_display from a second thread.
+        # Read once here; changing it requires a plugin restart
+        self.async_push = bool(self.global_config.get('async_push', False))
 
         # Colors
         self.text_color = tuple(self.feeds_config.get('text_color', [255, 255, 255]))
@@ -154,9 +216,88 @@ class NewsTickerPlugin(BasePlugin):
             'priority': 2
         })
 
+        # Shared HTTP session with keep-alive and connection pooling.
+        # Most predefined feeds share the same ESPN hosts, so reusing
+        # connections avoids a TCP+TLS handshake per fetch.
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=self.background_config.get('max_retries', 3)
+        )
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+        self._http.headers.update({
+            'User-Agent': 'LEDMatrix-NewsPlugin/1.0 (RSS Reader)',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+
         # State
         self.current_headlines = []
+        self._headline_image_cache = {}
+        self._glyph_cache = {}
+        self._text_bitmap_cache = OrderedDict()
+        self._advance_tables = {}
+        self._logo_by_feed = {}
+        self._logo_path_cache = {}
+        self._strip_np = None
+        # Columns of black padding on each side of the numpy strip mirror -
+        # lets every scroll position slice fully in-bounds with no per-frame
+        # edge handling
+        self._strip_pad = 0
+        self._frame_np = None
+        # Second frame buffer for the async push path - the render loop
+        # flips between the two so composition never writes into an array
+        # the worker is still transmitting
+        self._frame_np_alt = None
+        # ndarray of the most recent frame, for the raw-buffer handoff path
+        self._last_frame_np = None
+        # Optional zero-copy handoff: newer display managers accept a raw
+        # ndarray buffer, skipping the PIL.Image round trip entirely
+        self._dm_set_buffer = getattr(display_manager, 'set_buffer', None)
+        # Native-depth handoff: displays that declare an RGB565 framebuffer
+        # get frames quantized to uint16 before the raw-buffer push, halving
+        # the bytes shipped per frame
+        fmt = getattr(display_manager, 'native_format', None)
+        self._native_rgb565 = (
+            np is not None and isinstance(fmt, str) and fmt.lower() in ('rgb565', '565')
+        )
+        self._frame_565 = None
+        self._frame_565_alt = None
+        # Optional dirty-rect push: some display managers accept
+        # update_display(rect=(x, y, w, h)) and only ship the changed
+        # region over the bus
+        self._dm_rect_update = False
+        try:
+            sig = inspect.signature(display_manager.update_display)
+            self._dm_rect_update = 'rect' in sig.parameters
+        except (TypeError, ValueError):
+            pass
+        # (message-key, bitmap size) of the status frame currently on the
+        # panel, if any - lets repeat status pushes be skipped or reduced
+        # to their dirty rect
+        self._last_status = None
         self.last_update = 0
+        # Per-feed freshness tracking - avoids a cache_manager round trip
+        # (potentially disk-backed) for feeds fetched recently
+        self._feed_last_update = {}
+        self._feed_headlines_memo = {}
+        # Cross-feed duplicate titles dropped by the last merge, for get_info
+        self._duplicates_dropped = 0
+        # Signature of the last fetched headline set, used to skip strip
+        # rebuilds when a refresh returns the same titles
+        self._headlines_sig = None
+        # Memoized get_info() payload, rebuilt after updates/config changes
+        self._info_cache = None
+        # Resolved display duration - recomputed when the strip or config
+        # changes so the hot getter is a plain attribute read
+        self._effective_duration = float(self.display_duration)
+        # Parallel render arrays mirroring current_headlines - the render
+        # path indexes these instead of walking the list of dicts, and
+        # title widths are premeasured at publish time
+        self._feed_names = ()
+        self._titles = ()
+        self._title_widths = ()
         self.rotation_count = 0
         self._cycle_complete = False
         self.initialized = True
@@ -164,6 +305,17 @@ class NewsTickerPlugin(BasePlugin):
         # Load fonts
         self.fonts = self._load_fonts()
 
+        # Pre-rasterize the printable-ASCII atlas so the first ticker build
+        # doesn't pay the full glyph rasterization cost at display time
+        self._prewarm_glyph_atlas()
+
+        # Resolve the status-screen font once instead of per frame
+        self._default_font = self.fonts.get('headline') or ImageFont.load_default()
+
+        # Pre-render the known status messages into the bitmap cache so even
+        # the first no-data frame is a cache hit
+        self._prewarm_status_bitmaps()
+
         # Initialize LogoHelper for news source logos
         self.logo_helper = LogoHelper(
             display_width=self.display_width,
@@ -171,9 +323,21 @@ class NewsTickerPlugin(BasePlugin):
             logger=self.logger
         )
 
+        # Reusable framebuffer for the static status screens - cleared and
+        # redrawn in place instead of allocating a fresh image per call
+        self._frame_img = Image.new('RGB', (self.display_width, self.display_height), (0, 0, 0))
+        self._frame_draw = ImageDraw.Draw(self._frame_img)
+
         # Initialize ScrollHelper
         self.scroll_helper = ScrollHelper(self.display_width, self.display_height, logger=self.logger)
-        
+
+        # Detect once whether the installed ScrollHelper exposes its scroll
+        # position - the numpy window path needs it, and checking here keeps
+        # the per-frame read a plain attribute hit (a defaulted getattr
+        # exercises the exception machinery on every call). Helpers without
+        # it fall back to get_visible_portion(), same as before
+        self._sh_has_position = hasattr(self.scroll_helper, 'scroll_position')
+
         # Enable scrolling for high FPS mode
         self.enable_scrolling = True
         self.logger.info(f"News ticker enable_scrolling set to: {self.enable_scrolling}")
@@ -181,6 +345,38 @@ class NewsTickerPlugin(BasePlugin):
         # Configure ScrollHelper with plugin settings
         self._configure_scroll_settings()
 
+        # Background fetch thread - keeps HTTP + XML work off the display
+        # thread so scroll animation never stalls on slow feeds
+        self._headlines_lock = threading.Lock()
+        # Serializes update() runs - the host scheduler can call update()
+        # (on_config_change zeroes last_update to force one) while the
+        # daemon loop is mid-refresh, and cache_manager plus the per-feed
+        # memos are only safe with one updater at a time
+        self._update_lock = threading.Lock()
+        self._bg_stop = threading.Event()
+        self._bg_thread = None
+        if self.background_config.get('enabled', True):
+            self._bg_thread = threading.Thread(
+                target=self._background_update_loop,
+                name=f"{plugin_id}-feed-updater",
+                daemon=True
+            )
+            self._bg_thread.start()
+
+        # Display push worker - hands update_display to its own thread so
+        # the render loop can compose the next frame while the current one
+        # is going out over the bus
+        self._push_queue = None
+        self._push_thread = None
+        if self.async_push:
+            self._push_queue = queue.Queue(maxsize=1)
+            self._push_thread = threading.Thread(
+                target=self._push_worker,
+                name=f"{plugin_id}-frame-push",
+                daemon=True
+            )
+            self._push_thread.start()
+
         # Log enabled feeds
         enabled_feeds = self.feeds_config.get('enabled_feeds', [])
         custom_feeds = self.feeds_config.get('custom_feeds', [])
@@ -217,16 +413,18 @@ class NewsTickerPlugin(BasePlugin):
         try:
             # Try to load Press Start 2P font
             font_path = self.global_config.get('font_path', 'assets/fonts/PressStart2P-Regular.ttf')
-            fonts['headline'] = ImageFont.truetype(font_path, self.font_size)
-            fonts['separator'] = ImageFont.truetype(font_path, self.font_size)
-            fonts['info'] = ImageFont.truetype(font_path, 6)
+            fonts['headline'] = _load_truetype(font_path, self.font_size)
+            # Separator uses the same face and size - share the FreeType
+            # instance instead of loading a duplicate
+            fonts['separator'] = fonts['headline']
+            fonts['info'] = _load_truetype(font_path, 6)
             self.logger.info("Successfully loaded Press Start 2P font")
         except IOError:
             self.logger.warning("Press Start 2P font not found, trying 4x6 font")
             try:
-                fonts['headline'] = ImageFont.truetype("assets/fonts/4x6-font.ttf", self.font_size)
-                fonts['separator'] = ImageFont.truetype("assets/fonts/4x6-font.ttf", self.font_size)
-                fonts['info'] = ImageFont.truetype("assets/fonts/4x6-font.ttf", 6)
+                fonts['headline'] = _load_truetype("assets/fonts/4x6-font.ttf", self.font_size)
+                fonts['separator'] = fonts['headline']
+                fonts['info'] = _load_truetype("assets/fonts/4x6-font.ttf", 6)
                 self.logger.info("Successfully loaded 4x6 font")
             except IOError:
                 self.logger.warning("4x6 font not found, using default PIL font")
@@ -366,6 +564,7 @@ class NewsTickerPlugin(BasePlugin):
             max_duration=self.max_duration,
             buffer=self.duration_buffer
         )
+        self._refresh_effective_duration()
 
     def validate_config(self) -> bool:
         """Validate plugin configuration."""
@@ -494,12 +693,21 @@ class NewsTickerPlugin(BasePlugin):
             else:
                 custom_feed_names = list(new_custom_feeds.keys()) if isinstance(new_custom_feeds, dict) else []
             self.logger.info(f"Feeds configuration updated. Custom feeds: {custom_feed_names}, Enabled feeds: {list(new_enabled_feeds)}")
-            # Clear headlines cache to force refresh
-            self.current_headlines = []
+            # Clear headlines cache to force refresh - under the lock, like
+            # the other writers (update publish and rotation), so a
+            # concurrent background publish can't leave the list and the
+            # render arrays inconsistent
+            with self._headlines_lock:
+                self.current_headlines = []
+                self._feed_names = ()
+                self._titles = ()
+                self._title_widths = ()
             if hasattr(self, 'scroll_helper'):
                 self.scroll_helper.clear_cache()
             # Trigger immediate update on next display cycle
             self.last_update = 0  # Force update() to run immediately
+            self._feed_last_update = {}
+            self._feed_headlines_memo = {}
         
         # Update feed-related settings
         self.text_color = tuple(self.feeds_config.get('text_color', [255, 255, 255]))
@@ -509,6 +717,9 @@ class NewsTickerPlugin(BasePlugin):
         self.logo_size = self.feeds_config.get('logo_size', default_logo_size)
         # Keep feed_logo_map for backward compatibility
         self.feed_logo_map = self.feeds_config.get('feed_logo_map', {})
+        # Logo sources or sizing may have changed - reload lazily on next update
+        self._logo_by_feed = {}
+        self._logo_path_cache = {}
         
         # Update global config settings
         self.global_config = new_config.get('global', {})
@@ -566,160 +777,392 @@ class NewsTickerPlugin(BasePlugin):
         # Reload fonts if font size changed
         if self.font_size != old_font_size:
             self.fonts = self._load_fonts()
+            # Glyph and text bitmaps are keyed by font object, so drop them
+            # with the old fonts
+            self._glyph_cache = {}
+            self._text_bitmap_cache = OrderedDict()
+            self._advance_tables = {}
+            self._prewarm_glyph_atlas()
+            self._default_font = self.fonts.get('headline') or ImageFont.load_default()
+            self._prewarm_status_bitmaps()
+
+        # Settings surfaced through get_info() may have changed
+        self._info_cache = None
+
+    def _background_update_loop(self) -> None:
+        """
+        Periodically refresh headlines on a daemon thread.
+
+        update() publishes the new headline list atomically, so display()
+        only ever sees a complete set and never blocks on network I/O.
+        """
+        while not self._bg_stop.is_set():
+            try:
+                self.update()
+            except Exception as e:
+                self.logger.error(f"Background headline update failed: {e}")
+            interval = self.global_config.get('update_interval', 300)
+            self._bg_stop.wait(max(1, interval))
+
+    def _push_worker(self) -> None:
+        """
+        Run display pushes on a daemon thread.
+
+        The render loop assigns the framebuffer (or hands over a raw
+        buffer) and then signals through the queue; this thread only calls
+        update_display, so a slow SPI/I2C transmit no longer stalls frame
+        composition.
+        """
+        while not self._bg_stop.is_set():
+            try:
+                item = self._push_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            try:
+                self.display_manager.update_display()
+            except Exception as e:
+                self.logger.error(f"Async display push failed: {e}")
+
+    def _push_display(self) -> None:
+        """Trigger a display push, deferring to the worker when enabled."""
+        q = self._push_queue
+        if q is None:
+            self.display_manager.update_display()
+            return
+        try:
+            q.put_nowait(True)
+        except queue.Full:
+            # Worker is still transmitting; its pending push will pick up
+            # the freshly assigned framebuffer anyway
+            pass
 
     def update(self) -> None:
         """Update news headlines from all enabled feeds."""
         if not self.initialized:
             return
 
+        # Nothing configured - skip all per-tick work (list building,
+        # headline trimming, cache clearing) until feeds are enabled
+        enabled_feeds = self.feeds_config.get('enabled_feeds', [])
+        custom_feeds = self.feeds_config.get('custom_feeds', [])
+        if not enabled_feeds and not custom_feeds:
+            return
+
+        # One update at a time: a host-triggered call arriving while the
+        # daemon loop is mid-refresh would interleave cache_manager access
+        # and the per-feed memos from two threads (and double-fetch every
+        # feed). The loser skips - the run in flight fetches the same feeds
+        if not self._update_lock.acquire(False):
+            self.logger.debug("Update already in progress, skipping")
+            return
+
         try:
-            self.current_headlines = []
+            new_headlines = []
             feed_stats = {'success': 0, 'failed': 0, 'total': 0}
 
-            # Fetch from enabled predefined feeds
-            enabled_feeds = self.feeds_config.get('enabled_feeds', [])
-            for feed_name in enabled_feeds:
-                if feed_name in self.DEFAULT_FEEDS:
-                    feed_stats['total'] += 1
-                    headlines = self._fetch_feed_headlines(feed_name, self.DEFAULT_FEEDS[feed_name])
-                    if headlines:
-                        self.current_headlines.extend(headlines)
-                        feed_stats['success'] += 1
-                    else:
-                        feed_stats['failed'] += 1
-
-            # Fetch from custom feeds (use array order)
-            custom_feeds = self.feeds_config.get('custom_feeds', [])
-            
+            # Build the full list of feeds to fetch (predefined + custom)
+            feed_items = [
+                (feed_name, self.DEFAULT_FEEDS[feed_name])
+                for feed_name in enabled_feeds
+                if feed_name in self.DEFAULT_FEEDS
+            ]
+
+            # Add custom feeds (use array order)
             # Handle both old dict format (backward compatibility) and new array format
             if isinstance(custom_feeds, dict):
                 # Old format - process all feeds
-                feed_list = [(name, url) for name, url in custom_feeds.items()]
+                feed_items.extend((name, url) for name, url in custom_feeds.items())
             elif isinstance(custom_feeds, list):
                 # New format - filter by enabled and use array order
-                feed_list = [
+                feed_items.extend(
                     (feed.get('name'), feed.get('url'))
                     for feed in custom_feeds
                     if isinstance(feed, dict) and feed.get('enabled', True)
-                ]
-            else:
-                feed_list = []
-            
-            for feed_name, feed_url in feed_list:
-                if not feed_name or not feed_url:
+                )
+
+            feed_items = [(name, url) for name, url in feed_items if name and url]
+
+            # Resolve memo/cache hits on this thread, then fetch the rest in
+            # parallel - network I/O releases the GIL, so total latency
+            # becomes max(feed_time) instead of sum(feed_time). Workers do
+            # network + parse only: the host cache_manager's thread-safety
+            # is unverified, so all its reads and writes stay on this thread
+            update_interval = self.global_config.get('update_interval', 300)
+            results = {}
+            to_fetch = []
+            stale_entries = {}
+            for name, url in feed_items:
+                cached = self._cached_feed_headlines(name, update_interval)
+                if cached is not None:
+                    results[name] = cached
                     continue
+                # Stale-but-alive entries (TTL is 2x the update interval)
+                # still carry HTTP validators, letting the server answer
+                # 304 with no body
+                stale_entries[name] = self.cache_manager.get(f"news_{name}")
+                to_fetch.append((name, url))
+
+            if to_fetch:
+                with ThreadPoolExecutor(max_workers=min(10, len(to_fetch))) as executor:
+                    futures = {
+                        executor.submit(
+                            self._fetch_feed_headlines, name, url, stale_entries.get(name)
+                        ): name
+                        for name, url in to_fetch
+                    }
+                    for future in as_completed(futures):
+                        feed_name = futures[future]
+                        try:
+                            headlines, cache_entry = future.result()
+                        except Exception as e:
+                            self.logger.error(f"Error fetching feed {feed_name}: {e}")
+                            results[feed_name] = []
+                            continue
+                        # Cache write and memo update happen here, after the
+                        # worker has returned its result
+                        if cache_entry is not None:
+                            self.cache_manager.set(
+                                f"news_{feed_name}", cache_entry,
+                                ttl=update_interval * 2
+                            )
+                            self._remember_feed_result(feed_name, headlines)
+                        results[feed_name] = headlines
+
+            # Merge results in configured feed order so display order stays
+            # deterministic. Wire stories syndicate across feeds, so drop
+            # repeated titles - the strip and the per-string bitmap caches
+            # then only pay for unique headlines. Interning the surviving
+            # titles lets cache-key comparisons short-circuit on identity.
+            seen_titles = set()
+            duplicates = 0
+            for feed_name, feed_url in feed_items:
                 feed_stats['total'] += 1
-                headlines = self._fetch_feed_headlines(feed_name, feed_url)
+                headlines = results.get(feed_name, [])
                 if headlines:
-                    self.current_headlines.extend(headlines)
+                    for headline in headlines:
+                        title = sys.intern(headline['title'])
+                        if title in seen_titles:
+                            duplicates += 1
+                            continue
+                        seen_titles.add(title)
+                        headline['title'] = title
+                        new_headlines.append(headline)
                     feed_stats['success'] += 1
                 else:
                     feed_stats['failed'] += 1
+            self._duplicates_dropped = duplicates
+            if duplicates:
+                self.logger.debug(f"Dropped {duplicates} duplicate headline(s) across feeds")
 
             # Log feed status summary
             if feed_stats['total'] > 0:
                 self.logger.info(
                     f"Feed update complete: {feed_stats['success']}/{feed_stats['total']} feeds successful, "
-                    f"{len(self.current_headlines)} headlines retrieved"
+                    f"{len(new_headlines)} headlines retrieved"
                 )
                 if feed_stats['failed'] > 0:
                     self.logger.warning(f"{feed_stats['failed']} feed(s) failed to fetch headlines")
 
             # Limit total headlines and reset rotation tracking
             # Count enabled custom feeds
-            custom_feeds_list = self.feeds_config.get('custom_feeds', [])
-            if isinstance(custom_feeds_list, dict):
-                enabled_custom_count = len(custom_feeds_list)
+            if isinstance(custom_feeds, dict):
+                enabled_custom_count = len(custom_feeds)
             else:
-                enabled_custom_count = sum(1 for feed in custom_feeds_list if isinstance(feed, dict) and feed.get('enabled', True))
+                enabled_custom_count = sum(1 for feed in custom_feeds if isinstance(feed, dict) and feed.get('enabled', True))
             
             max_headlines = len(enabled_feeds) * self.headlines_per_feed + enabled_custom_count * self.headlines_per_feed
-            if len(self.current_headlines) > max_headlines:
-                self.current_headlines = self.current_headlines[:max_headlines]
+            if len(new_headlines) > max_headlines:
+                new_headlines = new_headlines[:max_headlines]
+
+            # Resolve and load feed logos once per feed, so rendering is a
+            # dict lookup instead of filesystem stats plus a resize
+            self._preload_feed_logos(new_headlines)
+
+            # Evict cached headline renders that dropped out of the feed set
+            if self._headline_image_cache:
+                live_titles = {(h['feed_name'], h['title']) for h in new_headlines}
+                self._headline_image_cache = {
+                    key: img for key, img in self._headline_image_cache.items()
+                    if (key[0], key[1]) in live_titles
+                }
 
-            # Reset rotation tracking for new content
-            if self.current_headlines:
+            # Publish the finished list atomically so display() (running on
+            # another thread) never observes a partially built update
+            with self._headlines_lock:
+                self.current_headlines = new_headlines
+                self._rebuild_render_arrays()
+
+            # Reset rotation tracking and rebuild the strip only when the
+            # headline set actually changed - feeds commonly return the same
+            # top-N titles, and re-rendering them would waste a full rebuild
+            new_sig = tuple((h['feed_name'], h['title']) for h in new_headlines)
+            if new_headlines and new_sig != self._headlines_sig:
                 self.rotation_count = 0
                 # Clear scroll cache to force recreation of scrolling image
-                if hasattr(self, 'scroll_helper'):
-                    self.scroll_helper.clear_cache()
+                self.scroll_helper.clear_cache()
+                self._strip_np = None
+            self._headlines_sig = new_sig
 
             self.last_update = time.time()
-            self.logger.debug(f"Updated news headlines: {len(self.current_headlines)} total")
+            self._info_cache = None
+            self.logger.debug(f"Updated news headlines: {len(new_headlines)} total")
 
         except Exception as e:
             self.logger.error(f"Error updating news headlines: {e}")
+        finally:
+            self._update_lock.release()
 
-    def _fetch_feed_headlines(self, feed_name: str, feed_url: str) -> List[Dict]:
-        """Fetch headlines from a specific RSS feed."""
-        cache_key = f"news_{feed_name}_{datetime.now().strftime('%Y%m%d%H')}"
-        update_interval = self.global_config.get('update_interval', 300)
+    def _cached_feed_headlines(self, feed_name: str, update_interval: int) -> Optional[List[Dict]]:
+        """
+        Return fresh headlines for a feed from memory or cache_manager, or
+        None when a network fetch is needed.
 
-        # Check cache first - cache_manager handles TTL internally
-        cached_data = self.cache_manager.get(cache_key, max_age=update_interval)
-        if cached_data:
+        Runs on the update() thread only - cache_manager access is confined
+        there because the host implementation's thread-safety is unverified.
+        """
+        # Fast path: this feed (not just some feed) was fetched recently,
+        # so return the in-memory copy without touching cache_manager
+        if (time.time() - self._feed_last_update.get(feed_name, 0)) < update_interval:
+            memo = self._feed_headlines_memo.get(feed_name)
+            if memo is not None:
+                self.logger.debug(f"Using in-memory headlines for {feed_name}")
+                return memo
+
+        # Check cache next - cache_manager handles TTL internally. Stable
+        # per-feed key: freshness is handled by max_age/TTL, so the key must
+        # not roll over (an hour-stamped key orphaned the cache entry and
+        # its HTTP validators at every hour boundary)
+        cached_entry = self.cache_manager.get(f"news_{feed_name}", max_age=update_interval)
+        if cached_entry:
             self.logger.debug(f"Using cached headlines for {feed_name}")
-            return cached_data
+            return self._remember_feed_result(feed_name, self._cached_headlines(cached_entry))
+        return None
+
+    def _fetch_feed_headlines(self, feed_name: str, feed_url: str, stale_entry=None):
+        """
+        Fetch headlines for one feed over HTTP.
+
+        Runs on executor workers, so it never touches cache_manager or the
+        in-memory memo; it returns (headlines, cache_entry) and update()
+        performs the cache write after the result comes back. cache_entry
+        is None when the fetch failed and there is nothing to store.
+        stale_entry is an expired cache entry whose HTTP validators are
+        sent as a conditional GET.
+        """
+        conditional_headers = {}
+        if isinstance(stale_entry, dict):
+            if stale_entry.get('etag'):
+                conditional_headers['If-None-Match'] = stale_entry['etag']
+            if stale_entry.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = stale_entry['last_modified']
 
         try:
             self.logger.info(f"Fetching headlines from {feed_name}...")
-            headers = {
-                'User-Agent': 'LEDMatrix-NewsPlugin/1.0 (RSS Reader)'
-            }
-            response = requests.get(feed_url, timeout=self.background_config.get('request_timeout', 30), headers=headers)
-            response.raise_for_status()
-
-            # Parse RSS XML
-            root = ET.fromstring(response.content)
-            headlines = []
-
-            # Extract headlines from RSS items
-            for item in root.findall('.//item')[:self.headlines_per_feed]:
-                title = item.find('title')
-                description = item.find('description')
-                pub_date = item.find('pubDate')
-                link = item.find('link')
-
-                if title is not None and title.text:
-                    headline = {
-                        'feed_name': feed_name,
-                        'title': html.unescape(title.text).strip(),
-                        'description': html.unescape(description.text).strip() if description is not None else '',
-                        'published': pub_date.text if pub_date is not None else '',
-                        'link': link.text if link is not None else '',
-                        'timestamp': datetime.now().isoformat()
-                    }
+            response = self._http.get(
+                feed_url,
+                timeout=self.background_config.get('request_timeout', 30),
+                headers=conditional_headers,
+                stream=True
+            )
 
-                    # Clean up the title (remove extra whitespace, fix common issues)
-                    headline['title'] = self._clean_headline(headline['title'])
-                    headlines.append(headline)
+            # 304 Not Modified - feed unchanged, reuse cached headlines
+            # without re-parsing; returning the stale entry tells update()
+            # to re-store it with a fresh TTL
+            if response.status_code == 304 and stale_entry:
+                self.logger.debug(f"Feed {feed_name} not modified, reusing cached headlines")
+                # Streamed response: close it so the connection goes back
+                # to the pool instead of leaking until GC
+                response.close()
+                return self._cached_headlines(stale_entry), stale_entry
 
-            # Cache the results
-            self.cache_manager.set(cache_key, headlines, ttl=update_interval * 2)
+            response.raise_for_status()
 
-            return headlines
+            # Parse RSS XML incrementally, straight off the wire - we only
+            # keep the first headlines_per_feed items, so stop as soon as we
+            # have them without buffering or tree-building the whole body
+            headlines = []
+            try:
+                response.raw.decode_content = True  # gunzip transparently for the parser
+                for event, elem in ET.iterparse(response.raw, events=('end',)):
+                    if elem.tag != 'item':
+                        continue
+
+                    title = elem.find('title')
+                    description = elem.find('description')
+                    pub_date = elem.find('pubDate')
+                    link = elem.find('link')
+
+                    if title is not None and title.text:
+                        headline = {
+                            'feed_name': feed_name,
+                            'title': html.unescape(title.text).strip(),
+                            'description': html.unescape(description.text).strip() if description is not None and description.text else '',
+                            'published': pub_date.text if pub_date is not None else '',
+                            'link': link.text if link is not None else '',
+                            'timestamp': datetime.now().isoformat()
+                        }
+
+                        # Clean up the title (remove extra whitespace, fix common issues)
+                        headline['title'] = self._clean_headline(headline['title'])
+                        headlines.append(headline)
+
+                    # Free the item's children and bail once we have enough
+                    elem.clear()
+                    if len(headlines) >= self.headlines_per_feed:
+                        break
+            finally:
+                # Discard the rest of the body (we may have broken out early)
+                response.close()
+
+            # Hand back the results along with HTTP validators so update()
+            # can cache them for later conditional GETs
+            return headlines, {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'headlines': headlines
+            }
 
         except requests.RequestException as e:
             self.logger.error(f"Error fetching RSS feed {feed_name}: {e}")
-            return []
+            return [], None
         except ET.ParseError as e:
             self.logger.error(f"Error parsing RSS feed {feed_name}: {e}")
-            return []
+            return [], None
         except Exception as e:
             self.logger.error(f"Error processing RSS feed {feed_name}: {e}")
-            return []
+            return [], None
+
+    def _remember_feed_result(self, feed_name: str, headlines: List[Dict]) -> List[Dict]:
+        """Record a feed's headlines and fetch time for the in-memory fast path."""
+        self._feed_last_update[feed_name] = time.time()
+        self._feed_headlines_memo[feed_name] = headlines
+        return headlines
+
+    @staticmethod
+    def _cached_headlines(cached_entry) -> List[Dict]:
+        """
+        Extract headlines from a cache entry.
+
+        Supports both the current dict format ({'etag', 'last_modified',
+        'headlines'}) and the old format where the headline list was cached
+        directly.
+        """
+        if isinstance(cached_entry, dict):
+            return cached_entry.get('headlines', [])
+        if isinstance(cached_entry, list):
+            return cached_entry
+        return []
 
     def _clean_headline(self, headline: str) -> str:
         """Clean and format headline text."""
         if not headline:
             return ""
 
-        # Remove extra whitespace
-        headline = re.sub(r'\s+', ' ', headline.strip())
-
-        # Remove common artifacts
-        headline = re.sub(r'^\s*-\s*', '', headline)  # Remove leading dashes
-        headline = re.sub(r'\s+', ' ', headline)  # Normalize whitespace
+        # Remove leading dashes, then collapse whitespace in a single pass
+        headline = self._LEAD_DASH_RE.sub('', headline.strip())
+        headline = self._WS_RE.sub(' ', headline)
 
         # Limit length for display
         if len(headline) > 100:
@@ -789,23 +1232,142 @@ class NewsTickerPlugin(BasePlugin):
             self._cycle_complete = True
 
         # Get visible portion
-        visible_portion = self.scroll_helper.get_visible_portion()
+        visible_portion = self._get_visible_frame()
         if visible_portion:
-            # Update display
-            self.display_manager.image.paste(visible_portion, (0, 0))
-            self.display_manager.update_display()
+            self._blit_frame(visible_portion)
 
         # Log frame rate (less frequently to avoid spam)
         self.scroll_helper.log_frame_rate()
 
+    def _get_visible_frame(self) -> Optional[Image.Image]:
+        """
+        Get the visible scroll window for the current frame.
+
+        When the cached strip has a numpy mirror and the scroll position is
+        exposed, the window is a direct array slice - no PIL crop machinery.
+        Falls back to ScrollHelper.get_visible_portion for wrap-around
+        positions or when numpy is unavailable.
+        """
+        self._last_frame_np = None
+        # Snapshot the mirror once - the background thread nulls the
+        # attribute when headlines change, so every later read must go
+        # through the local, not the attribute
+        strip = self._strip_np
+        if strip is not None and self._sh_has_position:
+            if self.scroll_helper.cached_image is None:
+                # Strip was cleared behind our back - drop the stale mirror
+                self._strip_np = None
+            else:
+                position = self.scroll_helper.scroll_position
+                if position is not None and strip.shape[0] == self.display_height:
+                    # The strip mirror is padded by a window of black on each
+                    # side, so every scroll position (including entry/exit)
+                    # is a plain in-bounds slice - pure pointer arithmetic
+                    width = self.display_width
+                    x = int(position) + self._strip_pad
+                    if 0 <= x and x + width <= strip.shape[1]:
+                        # Copy through a preallocated contiguous buffer -
+                        # Image.fromarray on a strided slice would do its own
+                        # contiguity copy anyway, and the copy helper is
+                        # JIT-compiled when numba is available
+                        if self._frame_np is None:
+                            self._frame_np = np.empty(
+                                (self.display_height, width, 3),
+                                dtype=np.uint8
+                            )
+                        frame_np = self._frame_np
+                        _copy_strip_window(frame_np, strip, x)
+                        if self._push_queue is not None:
+                            # Flip buffers: this frame goes to the push
+                            # worker while the next one is composed into
+                            # the other array
+                            if self._frame_np_alt is None:
+                                self._frame_np_alt = np.empty_like(frame_np)
+                            self._frame_np = self._frame_np_alt
+                            self._frame_np_alt = frame_np
+                        self._last_frame_np = frame_np
+                        return Image.fromarray(frame_np)
+        return self.scroll_helper.get_visible_portion()
+
+    def _blit_frame(self, frame: Image.Image) -> None:
+        """
+        Hand a finished frame to the display manager.
+
+        A full-size frame in the display's mode is assigned directly - the
+        same pattern the static display paths use - so no pixels are copied
+        at all. Mismatched frames fall back to paste. (np.asarray on a PIL
+        image allocates a fresh array rather than exposing a writable view,
+        so direct handoff is strictly cheaper than a numpy copy here.)
+
+        If the display manager accepts raw ndarray buffers and the frame
+        came from the numpy scroll path, hand the array over directly and
+        skip the PIL image entirely.
+        """
+        # A scroll frame replaces any status screen on the panel
+        self._last_status = None
+        if self._dm_set_buffer is not None and self._last_frame_np is not None:
+            try:
+                buf = self._last_frame_np
+                if self._native_rgb565:
+                    buf = self._pack_rgb565(buf)
+                self._dm_set_buffer(buf)
+                self._push_display()
+                return
+            except Exception as e:
+                # Display manager doesn't actually take our buffer - log
+                # once and stay on the PIL path from now on
+                self.logger.warning(f"Raw buffer handoff failed, using PIL path: {e}")
+                self._dm_set_buffer = None
+
+        dest = self.display_manager.image
+        if dest is None or (frame.size == dest.size and frame.mode == dest.mode):
+            self.display_manager.image = frame
+        else:
+            dest.paste(frame, (0, 0))
+        self._push_display()
+
+    def _pack_rgb565(self, frame):
+        """
+        Quantize an (h, w, 3) uint8 frame into the preallocated RGB565
+        buffer. One vectorized pass; the uint16 output is reused across
+        frames.
+        """
+        if self._frame_565 is None or self._frame_565.shape != frame.shape[:2]:
+            self._frame_565 = np.empty(frame.shape[:2], dtype=np.uint16)
+            self._frame_565_alt = None
+        out = self._frame_565
+        if self._push_queue is not None:
+            # Same flip as the frame buffers: don't repack into an array
+            # the push worker may still be transmitting
+            if self._frame_565_alt is None:
+                self._frame_565_alt = np.empty_like(out)
+            self._frame_565 = self._frame_565_alt
+            self._frame_565_alt = out
+        out[:] = (
+            ((frame[:, :, 0].astype(np.uint16) >> 3) << 11)
+            | ((frame[:, :, 1].astype(np.uint16) >> 2) << 5)
+            | (frame[:, :, 2] >> 3)
+        )
+        return out
+
     def _create_scrolling_image(self) -> None:
         """Create the scrolling news ticker image."""
         try:
-            # Create PIL Images for each headline
+            # Create PIL Images for each headline, pre-converted to the
+            # display's mode so no implicit conversion happens during strip
+            # assembly or per-frame paste/crop
+            display_image = self.display_manager.image
+            display_mode = display_image.mode if display_image is not None else 'RGB'
+            if len(self._titles) != len(self.current_headlines):
+                self._rebuild_render_arrays()
             headline_images = []
-            for headline in self.current_headlines:
-                headline_img = self._render_headline(headline)
+            for i, title in enumerate(self._titles):
+                headline_img = self._render_headline(
+                    self._feed_names[i], title, self._title_widths[i]
+                )
                 if headline_img:
+                    if headline_img.mode != display_mode:
+                        headline_img = headline_img.convert(display_mode)
                     headline_images.append(headline_img)
 
             if not headline_images:
@@ -830,6 +1392,29 @@ class NewsTickerPlugin(BasePlugin):
             # Dynamic duration is automatically calculated by create_scrolling_image()
             self._cycle_complete = False
 
+            # The strip length determines the dynamic duration - resolve the
+            # effective duration now that it has been recalculated
+            self._refresh_effective_duration()
+
+            # Cache the strip as a numpy array so the per-frame visible
+            # window is an array slice instead of a PIL crop. The mirror is
+            # padded with one window of black on each side so the scroll
+            # entry/exit positions slice fully in-bounds - per-frame work is
+            # then always a single window copy, never a fill-and-overlap
+            self._strip_np = None
+            if np is not None and self.scroll_helper.cached_image is not None:
+                strip = self.scroll_helper.cached_image
+                if strip.mode == 'RGB':
+                    base = np.asarray(strip)
+                    pad = self.display_width
+                    padded = np.zeros(
+                        (base.shape[0], base.shape[1] + 2 * pad, 3),
+                        dtype=np.uint8
+                    )
+                    padded[:, pad:pad + base.shape[1]] = base
+                    self._strip_np = padded
+                    self._strip_pad = pad
+
             self.logger.info(
                 "Created news ticker image: %d headlines, total_scroll_width=%dpx, dynamic_duration=%ds",
                 len(headline_images),
@@ -840,11 +1425,26 @@ class NewsTickerPlugin(BasePlugin):
         except Exception as e:
             self.logger.error(f"Error creating news ticker image: {e}")
             self.scroll_helper.clear_cache()
+            self._strip_np = None
 
     def _get_feed_logo_path(self, feed_name: str) -> Optional[Path]:
         """
-        Get the path to a feed's logo file.
-        
+        Get the path to a feed's logo file, memoized per feed name.
+
+        Resolution walks several directories with Path.exists, so cache the
+        outcome (including misses) in _logo_path_cache; the cache is cleared
+        alongside _logo_by_feed when feed config changes.
+        """
+        if feed_name in self._logo_path_cache:
+            return self._logo_path_cache[feed_name]
+        logo_path = self._resolve_feed_logo_path(feed_name)
+        self._logo_path_cache[feed_name] = logo_path
+        return logo_path
+
+    def _resolve_feed_logo_path(self, feed_name: str) -> Optional[Path]:
+        """
+        Resolve the path to a feed's logo file.
+
         Priority order:
         1. Integrated logo from feed object (new format) - logo.path field
         2. User-configured feed_logo_map (backward compatibility)
@@ -922,10 +1522,188 @@ class NewsTickerPlugin(BasePlugin):
         self.logger.debug(f"No logo found for {feed_name} (searched for {logo_filename})")
         return None
 
-    def _render_headline(self, headline: Dict[str, Any]) -> Optional[Image.Image]:
+    def _text_width(self, text: str, font) -> int:
+        """
+        Measure text width without a bbox pass or throwaway draw context.
+
+        ASCII strings sum the font's precomputed advance table, which both
+        skips the FreeType layout call and matches the glyph-composited
+        rendering exactly; anything else falls through to getlength.
+        """
+        table = self._advance_tables.get(id(font))
+        if table is not None:
+            width = 0
+            for ch in text:
+                idx = ord(ch) - 32
+                if 0 <= idx < len(table):
+                    width += table[idx]
+                else:
+                    width = -1
+                    break
+            if width >= 0:
+                return width
+
+        if hasattr(font, 'getlength'):
+            return int(round(font.getlength(text)))
+        # Bitmap fallback fonts (e.g. PIL default) predate getlength
+        bbox = font.getbbox(text)
+        return bbox[2] - bbox[0]
+
+    @staticmethod
+    def _line_height(font) -> int:
+        """
+        True line height (ascent + descent) for a font.
+
+        Using the full line box keeps vertical centering stable across
+        headlines - ink-box heights vary per string (e.g. with/without
+        descenders), which made text jump between headlines.
+        """
+        if hasattr(font, 'getmetrics'):
+            ascent, descent = font.getmetrics()
+            return ascent + descent
+        bbox = font.getbbox('Ag')
+        return bbox[3] - bbox[1]
+
+    def _glyph(self, ch: str, font: ImageFont.FreeTypeFont):
+        """
+        Get (or rasterize and cache) a single glyph mask.
+
+        Returns a (mask, advance) tuple where mask is the L-mode glyph raster
+        at full line height and advance is the horizontal advance in pixels.
+        Masks are color-independent, so one raster serves every text color.
+        """
+        key = (ch, id(font))
+        entry = self._glyph_cache.get(key)
+        if entry is None:
+            advance = max(1, int(round(font.getlength(ch))))
+            ascent, descent = font.getmetrics()
+            line_height = max(1, ascent + descent)
+            mask = Image.new('L', (advance, line_height), 0)
+            ImageDraw.Draw(mask).text((0, 0), ch, font=font, fill=255)
+            entry = (mask, advance)
+            self._glyph_cache[key] = entry
+        return entry
+
+    def _prewarm_glyph_atlas(self) -> None:
+        """
+        Eagerly rasterize printable ASCII glyphs for the loaded fonts.
+
+        Headlines are overwhelmingly ASCII, so warming the atlas up front
+        moves nearly all FreeType work to init time; anything unusual still
+        rasterizes lazily through _glyph.
+        """
+        try:
+            unique_fonts = {id(font): font for font in self.fonts.values()}
+            for font in unique_fonts.values():
+                if not isinstance(font, ImageFont.FreeTypeFont):
+                    continue
+                advances = []
+                for codepoint in range(32, 127):
+                    advances.append(self._glyph(chr(codepoint), font)[1])
+                # Advance table for O(1)-per-char width sums in _text_width
+                self._advance_tables[id(font)] = tuple(advances)
+            self.logger.debug(f"Prewarmed glyph atlas: {len(self._glyph_cache)} glyphs")
+        except Exception as e:
+            self.logger.warning(f"Error prewarming glyph atlas: {e}")
+
+    def _draw_text_cached(self, draw: ImageDraw.ImageDraw, img: Image.Image,
+                          xy: tuple, text: str, font, fill: tuple) -> None:
+        """
+        Draw text by compositing cached glyph masks instead of calling
+        draw.text, which re-enters FreeType layout/rasterization per call.
+
+        Glyph masks are stitched into one L-mode run mask (1 byte/pixel
+        intermediate instead of RGB), then colorized with a single bulk
+        paste, matching draw.text placement (xy is the top of the line box).
+        Falls back to draw.text for non-FreeType fonts.
+        """
+        if not isinstance(font, ImageFont.FreeTypeFont):
+            draw.text(xy, text, font=font, fill=fill)
+            return
+
+        entries = [self._glyph(ch, font) for ch in text]
+        if not entries:
+            return
+
+        run_width = sum(advance for _, advance in entries)
+        line_height = entries[0][0].height
+        run_mask = Image.new('L', (max(1, run_width), line_height), 0)
+        x_offset = 0
+        for mask, advance in entries:
+            run_mask.paste(mask, (x_offset, 0))
+            x_offset += advance
+
+        color_img = Image.new('RGB', run_mask.size, fill)
+        img.paste(color_img, (int(xy[0]), int(xy[1])), run_mask)
+
+    def _rebuild_render_arrays(self) -> None:
+        """
+        Mirror current_headlines into parallel render arrays.
+
+        Feed names, titles, and premeasured title widths live in flat tuples
+        so strip building indexes adjacent values instead of chasing one
+        dict per headline.
+        """
+        headlines = self.current_headlines
+        self._feed_names = tuple(h.get('feed_name', 'Unknown') for h in headlines)
+        self._titles = tuple(h.get('title', 'No title') for h in headlines)
+        headline_font = self.fonts['headline']
+        self._title_widths = tuple(self._text_width(t, headline_font) for t in self._titles)
+
+    def _load_feed_logo(self, feed_name: str):
+        """
+        Resolve and load a feed's logo, sized for the ticker.
+
+        Returns a (sprite, mask) tuple - an RGB sprite plus the split-off
+        L-mode alpha mask (None for opaque logos) - so pasting is a plain
+        masked copy instead of per-paste RGBA alpha compositing.
+        """
+        logo_path = self._get_feed_logo_path(feed_name)
+        if not logo_path:
+            return None
+        logo = self.logo_helper.load_logo(
+            feed_name,
+            logo_path,
+            max_width=self.logo_size,
+            max_height=self.logo_size
+        )
+        if logo is None:
+            return None
+        # Clamp oversized logos here so nothing bigger than logo_size ever
+        # reaches the paste path; NEAREST is plenty for matrix-sized icons
+        # and skips the convolution cost of the smoother kernels
+        if logo.width > self.logo_size or logo.height > self.logo_size:
+            resample = getattr(getattr(Image, 'Resampling', Image), 'NEAREST')
+            logo.thumbnail((self.logo_size, self.logo_size), resample)
+        if logo.mode == 'RGBA':
+            mask = logo.split()[-1]
+            sprite = logo.convert('RGB')
+        else:
+            mask = None
+            sprite = logo if logo.mode == 'RGB' else logo.convert('RGB')
+        return (sprite, mask)
+
+    def _preload_feed_logos(self, headlines: List[Dict]) -> None:
+        """
+        Load logos for all feeds present in the given headlines.
+
+        Caches loaded (and missing) logos in self._logo_by_feed so
+        _render_headline never hits the filesystem on the render path.
+        """
+        if not self.show_logos:
+            return
+        for feed_name in {h.get('feed_name') for h in headlines}:
+            if feed_name and feed_name not in self._logo_by_feed:
+                self._logo_by_feed[feed_name] = self._load_feed_logo(feed_name)
+
+    def _render_headline(self, feed_name: str, title: str,
+                         title_width: Optional[int] = None) -> Optional[Image.Image]:
         """
         Render a single headline as a PIL Image.
-        
+
+        title_width, when given, is the premeasured width from the render
+        arrays; it is measured on demand otherwise.
+
         When a logo is present:
         - Logo replaces the "[Feed Name]: " prefix
         - Logo replaces the " • " separator
@@ -937,38 +1715,44 @@ class NewsTickerPlugin(BasePlugin):
         - Format: [Feed Name]: Title • 
         """
         try:
-            title = headline.get('title', 'No title')
-            feed_name = headline.get('feed_name', 'Unknown')
-
-            # Calculate text dimensions
-            draw_temp = ImageDraw.Draw(Image.new('RGB', (1, 1)))
-            
-            # Get text dimensions for title
-            title_bbox = draw_temp.textbbox((0, 0), title, font=self.fonts['headline'])
-            title_width = title_bbox[2] - title_bbox[0]
-            title_height = title_bbox[3] - title_bbox[1]
+            # Reuse the rendered image if nothing affecting its pixels changed
+            cache_key = (feed_name, title, self.show_logos, self.font_size,
+                         self.text_color, self.separator_color, self.logo_size)
+            cached_img = self._headline_image_cache.get(cache_key)
+            if cached_img is not None:
+                return cached_img
+
+            # Resolve each font once per render instead of a dict lookup
+            # at every measure/draw call site below
+            headline_font = self.fonts['headline']
+            info_font = self.fonts['info']
+            separator_font = self.fonts['separator']
+
+            # Measure text widths with font.getlength - a width-only layout
+            # pass, no throwaway image or bbox computation needed
+            if title_width is None:
+                title_width = self._text_width(title, headline_font)
+            title_height = self._line_height(headline_font)
 
             # Load logo if enabled
-            logo = None
+            logo_sprite = None
+            logo_mask = None
             logo_width = 0
             logo_spacing = 0
             if self.show_logos:
-                logo_path = self._get_feed_logo_path(feed_name)
-                if logo_path:
-                    logo = self.logo_helper.load_logo(
-                        feed_name,
-                        logo_path,
-                        max_width=self.logo_size,
-                        max_height=self.logo_size
-                    )
-                    if logo:
-                        logo_width = logo.width
-                        logo_spacing = 4  # Space between logo and text
+                if feed_name not in self._logo_by_feed:
+                    # Fallback for headlines rendered before preload ran
+                    self._logo_by_feed[feed_name] = self._load_feed_logo(feed_name)
+                logo_entry = self._logo_by_feed[feed_name]
+                if logo_entry:
+                    logo_sprite, logo_mask = logo_entry
+                    logo_width = logo_sprite.width
+                    logo_spacing = 4  # Space between logo and text
 
             # Determine what to show based on logo availability
             # If logo exists: show logo + title (no feed name, no separator)
             # If logo missing: show feed name + title + separator
-            has_logo = logo is not None
+            has_logo = logo_sprite is not None
             
             if has_logo:
                 # With logo: [Logo] Title
@@ -983,16 +1767,14 @@ class NewsTickerPlugin(BasePlugin):
             feed_width = 0
             feed_height = 0
             if feed_text:
-                feed_bbox = draw_temp.textbbox((0, 0), feed_text, font=self.fonts['info'])
-                feed_width = feed_bbox[2] - feed_bbox[0]
-                feed_height = feed_bbox[3] - feed_bbox[1]
+                feed_width = self._text_width(feed_text, info_font)
+                feed_height = self._line_height(info_font)
 
             separator_width = 0
             separator_height = 0
             if separator_text:
-                separator_bbox = draw_temp.textbbox((0, 0), separator_text, font=self.fonts['separator'])
-                separator_width = separator_bbox[2] - separator_bbox[0]
-                separator_height = separator_bbox[3] - separator_bbox[1]
+                separator_width = self._text_width(separator_text, separator_font)
+                separator_height = self._line_height(separator_font)
 
             # Calculate total width
             total_width = logo_width + logo_spacing + feed_width + title_width + separator_width + 32  # Add padding
@@ -1007,62 +1789,123 @@ class NewsTickerPlugin(BasePlugin):
             current_x = 0
 
             # Draw logo if available (replaces feed name and separator)
-            if logo:
-                # Center logo vertically within display height
-                logo_y = (total_height - logo.height) // 2
-                headline_img.paste(logo, (current_x, logo_y), logo if logo.mode == 'RGBA' else None)
+            if logo_sprite:
+                # Center logo vertically within display height; the
+                # pre-split mask makes this a plain masked copy, not an
+                # RGBA alpha-composite
+                logo_y = (total_height - logo_sprite.height) // 2
+                headline_img.paste(logo_sprite, (current_x, logo_y), logo_mask)
                 current_x += logo_width + logo_spacing
 
             # Draw feed name (only if no logo)
             if feed_text:
                 feed_text_y = (total_height - feed_height) // 2
-                draw.text((current_x, feed_text_y), feed_text, font=self.fonts['info'], fill=(150, 150, 150))
+                self._draw_text_cached(draw, headline_img, (current_x, feed_text_y), feed_text, info_font, (150, 150, 150))
                 current_x += feed_width
 
             # Draw title
             title_y = (total_height - title_height) // 2
-            draw.text((current_x, title_y), title, font=self.fonts['headline'], fill=self.text_color)
+            self._draw_text_cached(draw, headline_img, (current_x, title_y), title, headline_font, self.text_color)
             current_x += title_width
 
             # Draw separator (only if no logo) - use bullet point separator
             if separator_text:
                 separator_x = current_x + 8
                 separator_y = (total_height - separator_height) // 2
-                draw.text((separator_x, separator_y), separator_text, font=self.fonts['separator'], fill=self.separator_color)
+                self._draw_text_cached(draw, headline_img, (separator_x, separator_y), separator_text, separator_font, self.separator_color)
 
+            self._headline_image_cache[cache_key] = headline_img
             return headline_img
 
         except Exception as e:
             self.logger.error(f"Error rendering headline: {e}")
             return None
 
+    def _render_text_bitmap(self, text: str, font, fill: tuple) -> Image.Image:
+        """
+        Render a tightly sized standalone text bitmap, LRU-cached.
+
+        Repeat frames of the same message (status/error screens redraw every
+        cycle) become a cache lookup plus paste instead of a fresh rasterize.
+        """
+        key = (text, id(font), fill)
+        cached = self._text_bitmap_cache.get(key)
+        if cached is not None:
+            self._text_bitmap_cache.move_to_end(key)
+            return cached
+
+        width = max(1, self._text_width(text, font))
+        height = max(1, self._line_height(font))
+        img = Image.new('RGB', (width, height), (0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        self._draw_text_cached(draw, img, (0, 0), text, font, fill)
+
+        self._text_bitmap_cache[key] = img
+        if len(self._text_bitmap_cache) > self.TEXT_BITMAP_CACHE_SIZE:
+            self._text_bitmap_cache.popitem(last=False)
+        return img
+
+    def _prewarm_status_bitmaps(self) -> None:
+        """Pre-render the fixed status messages shown by the no-data paths."""
+        try:
+            for message, fill in (
+                ("No Feeds Enabled", (150, 150, 150)),
+                ("No Headlines Available", (150, 150, 150)),
+            ):
+                self._render_text_bitmap(message, self._default_font, fill)
+        except Exception as e:
+            self.logger.warning(f"Error prewarming status bitmaps: {e}")
+
     def _display_no_headlines(self):
         """Display message when no headlines are available."""
-        img = Image.new('RGB', (self.display_width, self.display_height), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
         # Determine the reason for no headlines
         enabled_feeds = self.feeds_config.get('enabled_feeds', [])
         custom_feeds = self.feeds_config.get('custom_feeds', {})
         total_feeds = len(enabled_feeds) + len(custom_feeds)
-        
+
         if total_feeds == 0:
             message = "No Feeds Enabled"
         else:
             message = "No Headlines Available"
-        
-        draw.text((5, 12), message, font=self.fonts.get('headline', ImageFont.load_default()), fill=(150, 150, 150))
 
-        self.display_manager.image = img
-        self.display_manager.update_display()
+        self._display_status_message(message, (150, 150, 150))
 
     def _display_error(self, message: str):
         """Display error message."""
-        img = Image.new('RGB', (self.display_width, self.display_height), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        draw.text((5, 12), message, font=self.fonts.get('headline', ImageFont.load_default()), fill=(255, 0, 0))
+        self._display_status_message(message, (255, 0, 0))
+
+    def _display_status_message(self, message: str, fill: tuple) -> None:
+        """Draw a static status message into the reusable framebuffer."""
+        key = (message, fill)
+        prev = self._last_status
+        if prev is not None and prev[0] == key and self.display_manager.image is self._frame_img:
+            # Panel already shows exactly this frame - skip the push
+            return
 
-        self.display_manager.image = img
+        bitmap = self._render_text_bitmap(message, self._default_font, fill)
+        self._frame_draw.rectangle(
+            (0, 0, self.display_width, self.display_height), fill=(0, 0, 0)
+        )
+        self._frame_img.paste(bitmap, (5, 12))
+
+        self.display_manager.image = self._frame_img
+        self._last_status = (key, bitmap.size)
+
+        if self._dm_rect_update and prev is not None:
+            # Previous frame was also a status screen, so only the text
+            # band differs - push the union of the old and new text rects
+            rect = (
+                5, 12,
+                max(bitmap.width, prev[1][0]),
+                max(bitmap.height, prev[1][1]),
+            )
+            try:
+                self.display_manager.update_display(rect=rect)
+                return
+            except TypeError:
+                # Signature advertised rect but the call rejected it -
+                # fall back to full pushes permanently
+                self._dm_rect_update = False
         self.display_manager.update_display()
 
     def is_cycle_complete(self) -> bool:
@@ -1078,21 +1921,33 @@ class NewsTickerPlugin(BasePlugin):
         """
         return self._cycle_complete
 
-    def get_display_duration(self) -> float:
-        """Get display duration, using dynamic duration if enabled."""
-        # If dynamic duration is enabled and scroll helper has calculated a duration, use it
+    def _refresh_effective_duration(self) -> None:
+        """
+        Resolve the effective display duration once.
+
+        Called whenever the scroll strip or timing config changes, so the
+        frequently polled get_display_duration is a plain attribute read.
+        """
+        duration = 0
         if self.dynamic_duration_enabled:
             duration = self.scroll_helper.get_dynamic_duration()
-            if duration > 0:
-                return float(duration)
-        
-        # Fallback to configured duration
-        return float(self.display_duration)
+        self._effective_duration = float(duration) if duration > 0 else float(self.display_duration)
+
+    def get_display_duration(self) -> float:
+        """Get display duration, using dynamic duration if enabled."""
+        return self._effective_duration
 
     def get_info(self) -> Dict[str, Any]:
-        """Return plugin info for web UI."""
+        """Return plugin info for web UI, memoized between state changes."""
+        # The web UI polls this steadily; rebuild only after an update or
+        # config change invalidates the cached payload. Hand out a shallow
+        # copy so callers that merge extra fields into the payload can't
+        # poison the memo
+        if self._info_cache is not None:
+            return dict(self._info_cache)
+
         info = super().get_info()
-        
+
         # Get custom feed names (handle both formats)
         custom_feeds = self.feeds_config.get('custom_feeds', [])
         if isinstance(custom_feeds, list):
@@ -1102,6 +1957,7 @@ class NewsTickerPlugin(BasePlugin):
         
         info.update({
             'total_headlines': len(self.current_headlines),
+            'duplicate_headlines_dropped': self._duplicates_dropped,
             'enabled_feeds': self.feeds_config.get('enabled_feeds', []),
             'custom_feeds': custom_feed_names,
             'last_update': self.last_update,
@@ -1117,7 +1973,8 @@ class NewsTickerPlugin(BasePlugin):
             'logo_size': self.logo_size,
             'feed_logo_map': self.feed_logo_map
         })
-        return info
+        self._info_cache = info
+        return dict(info)
 
     def _rotate_headlines(self) -> None:
         """
@@ -1127,19 +1984,50 @@ class NewsTickerPlugin(BasePlugin):
         different headlines are shown first on subsequent cycles. This
         provides content freshness without waiting for RSS feed updates.
         """
-        if len(self.current_headlines) > 1:
-            # Move first headline to end
-            first_headline = self.current_headlines.pop(0)
-            self.current_headlines.append(first_headline)
-            self.logger.info(
-                "Rotated headlines: '%s' moved to end (now showing: '%s' first)",
-                first_headline.get('title', 'Unknown')[:50],
-                self.current_headlines[0].get('title', 'Unknown')[:50]
-            )
+        # Publish a rotated copy under the lock - the background update
+        # thread swaps current_headlines and rebuilds the render arrays
+        # under the same lock, so a pop/append here could interleave with
+        # a swap and append a stale headline to the new list
+        with self._headlines_lock:
+            headlines = self.current_headlines
+            if len(headlines) <= 1:
+                return
+            first_headline = headlines[0]
+            rotated = headlines[1:] + [first_headline]
+            self.current_headlines = rotated
+            self._rebuild_render_arrays()
+        self.logger.info(
+            "Rotated headlines: '%s' moved to end (now showing: '%s' first)",
+            first_headline.get('title', 'Unknown')[:50],
+            rotated[0].get('title', 'Unknown')[:50]
+        )
 
     def cleanup(self) -> None:
         """Cleanup resources."""
+        if hasattr(self, '_bg_stop'):
+            self._bg_stop.set()
+            if self._bg_thread is not None and self._bg_thread.is_alive():
+                self._bg_thread.join(timeout=2)
+        if getattr(self, '_push_queue', None) is not None:
+            try:
+                self._push_queue.put_nowait(None)
+            except queue.Full:
+                pass
+            if self._push_thread is not None and self._push_thread.is_alive():
+                self._push_thread.join(timeout=2)
         self.current_headlines = []
+        self._headline_image_cache = {}
+        self._glyph_cache = {}
+        self._text_bitmap_cache = OrderedDict()
+        self._logo_by_feed = {}
+        self._strip_np = None
+        self._frame_565 = None
+        self._frame_565_alt = None
+        if hasattr(self, '_http'):
+            try:
+                self._http.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing HTTP session: {e}")
         if hasattr(self, 'scroll_helper'):
             self.scroll_helper.clear_cache()
         self.logger.info("News ticker plugin cleaned up")